@@ -11,15 +11,28 @@ manifest.json is the single source of truth for the project.
 import hashlib
 import json
 import logging
+import mmap
+import random
+import re
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import (
+    parse_qsl, urlencode, urljoin, urlparse, urlsplit, urlunsplit,
+)
 
+import lxml.html
 import requests
 import yaml
-from bs4 import BeautifulSoup
+from bs4 import UnicodeDammit
+from lxml import etree
 from PyPDF2 import PdfReader
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -44,13 +57,98 @@ EXCLUDE_KEYWORDS = [
     "proxy", "notice-of-agm",
 ]
 
-SUBPAGE_KEYWORDS = [
-    "annual-report", "annual_report", "annualreport", "annual-reports",
-    "reports", "financial-reports", "publications",
-    "arsredovisning", "årsredovisning",
-    "reports-and-presentations", "financial-information",
-    "reporting", "report-archive",
-]
+# Subpage keyword -> priority; when a site exposes more candidate pages than
+# find_subpages returns, the ones most likely to list annual reports win
+SUBPAGE_KEYWORDS = {
+    "annual-report": 10, "annual_report": 10, "annualreport": 10, "annual-reports": 10,
+    "arsredovisning": 10, "årsredovisning": 10,
+    "report-archive": 8, "reports-and-presentations": 7, "financial-reports": 7,
+    "publications": 4, "reports": 3, "financial-information": 3,
+    "reporting": 2,
+}
+MAX_SUBPAGES = 8
+
+# IR pages rarely need more than this to expose their link graph
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml")
+
+# Parsed IR pages kept in memory per run (IR page + up to 8 subpages per company)
+PAGE_CACHE_SIZE = 512
+
+# Concurrent subpage fetches per IR site
+SUBPAGE_WORKERS = 4
+# Companies processed in parallel by run()
+COMPANY_WORKERS = 4
+# Minimum spacing between request starts to the same host (seconds)
+PER_HOST_INTERVAL = 0.5
+
+# PDF download attempts, first try included (config.yaml download.max_retries);
+# only connection errors, timeouts and RETRY_STATUSES are retried
+MAX_RETRIES = 3
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+# PDF read/write block size; chunks larger than the io buffer are written
+# straight through without an extra copy
+CHUNK_SIZE = 256 * 1024
+# Smallest file and page range accepted as an annual report
+MIN_PDF_KB = 500
+MIN_PAGES = 30
+MAX_PAGES = 600
+# Leading bytes read for the magic and the linearization dictionary
+PDF_HEAD_BYTES = 1024
+
+# PDF dictionary entries read by the fast page counter
+_PDF_REF_RE = re.compile(rb"\s*(\d+)\s+(\d+)\s+R")
+_PDF_PAGES_RE = re.compile(rb"/Pages\s+(\d+)\s+(\d+)\s+R")
+_PDF_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+_PDF_LIN_LENGTH_RE = re.compile(rb"/L\s+(\d+)")
+_PDF_LIN_PAGES_RE = re.compile(rb"/N\s+(\d+)")
+
+# Visible text of an anchor; like bs4's get_text, skips script, style and
+# template contents and comments
+_LINK_TEXT = etree.XPath(".//text()[not(ancestor::script or ancestor::style or ancestor::template)]")
+
+
+def _make_session():
+    """Shared session so requests to the same host reuse pooled connections.
+
+    The pool is sized for COMPANY_WORKERS x SUBPAGE_WORKERS concurrent fetches;
+    retries are handled by download_pdf, not urllib3.
+    """
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _make_session()
+
+# Next free request slot per host, shared by all worker threads
+_host_slots = {}
+_host_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url):
+    """Host part of `url`; links repeat across pages and years, so memoise it."""
+    return urlsplit(url).netloc
+
+
+def _wait_for_host(url):
+    """Block until `url`'s host may receive another request.
+
+    Request starts to one host are spaced PER_HOST_INTERVAL apart, so workers
+    hitting different hosts never wait on each other.
+    """
+    host = _netloc(url)
+    with _host_lock:
+        now = time.monotonic()
+        slot = max(now, _host_slots.get(host, 0.0))
+        _host_slots[host] = slot + PER_HOST_INTERVAL
+    if slot > now:
+        time.sleep(slot - now)
 
 
 # ---------------------------------------------------------------------------
@@ -102,7 +200,7 @@ def init_manifest(sources_path="report_sources.yaml", manifest_path="manifest.js
 
 
 # ---------------------------------------------------------------------------
-# Web scraping helpers (unchanged)
+# Web scraping helpers
 # ---------------------------------------------------------------------------
 
 def load_sources(path="report_sources.yaml"):
@@ -110,135 +208,364 @@ def load_sources(path="report_sources.yaml"):
         return yaml.safe_load(f)
 
 
-def fetch_page(url, timeout=30):
-    headers = {"User-Agent": USER_AGENT}
-    resp = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
-    resp.raise_for_status()
-    return resp.text
+def fetch_page(url, timeout=30, max_bytes=MAX_PAGE_BYTES):
+    """Fetch at most max_bytes of an HTML page and return the raw body."""
+    _wait_for_host(url)
+    resp = SESSION.get(url, timeout=timeout, allow_redirects=True, stream=True)
+    try:
+        resp.raise_for_status()
+        content_type = resp.headers.get("Content-Type", "text/html").lower()
+        if not content_type.startswith(HTML_CONTENT_TYPES):
+            raise ValueError(f"not an HTML page ({content_type})")
+        body = bytearray()
+        for chunk in resp.iter_content(chunk_size=65536):
+            body += chunk
+            if len(body) >= max_bytes:
+                break
+        return bytes(body[:max_bytes])
+    finally:
+        resp.close()
+
+
+def _join_url(origin, base_url, href):
+    """urljoin with fast paths for absolute and root-relative hrefs."""
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("/") and not href.startswith("//") and "/." not in href:
+        return origin + href
+    return urljoin(base_url, href)
 
 
 def extract_links(html, base_url):
-    soup = BeautifulSoup(html, "lxml")
+    # Parse with lxml directly and let XPath pick the anchors in C; bs4's
+    # encoding sniffing is kept so pages without a charset still decode.
+    # Already-decoded text is re-encoded, as lxml rejects str input that
+    # carries an XML encoding declaration
+    if not html.strip():
+        return []
+    if isinstance(html, str):
+        html, encoding = html.encode("utf-8"), "utf-8"
+    else:
+        encoding = UnicodeDammit(html, is_html=True).original_encoding
+    try:
+        doc = lxml.html.fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+    except etree.ParserError:
+        return []
+    base = urlparse(base_url)
+    origin = f"{base.scheme}://{base.netloc}"
     links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
+    for a in doc.xpath("//a[@href]"):
+        href = a.get("href").strip()
         if not href or href.startswith("#") or href.startswith("javascript:"):
             continue
-        links.append({"url": urljoin(base_url, href), "text": a.get_text(strip=True)})
+        if len(a):
+            text = "".join(t.strip() for t in _LINK_TEXT(a))
+        else:
+            text = (a.text or "").strip()
+        links.append({"url": _join_url(origin, base_url, href), "text": text})
     return links
 
 
+@lru_cache(maxsize=PAGE_CACHE_SIZE)
+def fetch_links(url):
+    """Links on the page at `url`.
+
+    Cached for the life of the process: every target year of a company crawls
+    the same IR page and subpages, so only the first year hits the network.
+    """
+    return extract_links(fetch_page(url), url)
+
+
+@lru_cache(maxsize=None)
+def _fiscal_year_re(year):
+    """Match a calendar year or a split fiscal year ending in it (2022, 2021/22, 2021-22).
+
+    Split years starting in `year` (2022/23) already contain `year` itself.
+    """
+    return re.compile(rf"{year}|{year - 1}[/-]{str(year)[-2:]}")
+
+
+@lru_cache(maxsize=None)
+def _name_keys(company_name, aliases=()):
+    """Lowercased first word of the company name followed by its aliases."""
+    return (company_name.lower().split()[0], *(a.lower() for a in aliases))
+
+
 def score_annual_report(link, year, company_name, aliases=None):
+    # Most links carry no year at all; reject them before lowercasing and
+    # concatenating anything (digits are case-insensitive anyway)
+    year_re = _fiscal_year_re(year)
+    if not (year_re.search(link["url"]) or year_re.search(link["text"])):
+        return -100
+
     url = link["url"].lower()
     text = link["text"].lower()
     combined = f"{url} {text}"
-    year_str = str(year)
-
-    fy_variants = [
-        year_str,
-        f"{year}/{str(year + 1)[-2:]}",
-        f"{year}-{str(year + 1)[-2:]}",
-        f"{year - 1}/{str(year)[-2:]}",
-        f"{year - 1}-{str(year)[-2:]}",
-    ]
-    if not any(v in combined for v in fy_variants):
-        return -100
+
+    if any(kw in combined for kw in EXCLUDE_KEYWORDS):
+        return -50
 
     score = 10
     if any(kw in combined for kw in ANNUAL_KEYWORDS):
         score += 20
-    if any(kw in combined for kw in EXCLUDE_KEYWORDS):
-        return -50
-    if url.lower().endswith(".pdf"):
+    if url.endswith(".pdf"):
         score += 10
     else:
         score -= 15
-    names = [company_name.lower().split()[0]]
-    if aliases:
-        names.extend(a.lower() for a in aliases)
-    if any(n in combined for n in names):
+    if any(n in combined for n in _name_keys(company_name, tuple(aliases or ()))):
         score += 5
     if "english" in combined or "/en/" in url:
         score += 3
     return score
 
 
+def canonical_url(url):
+    """Normalize a URL so trivially different spellings of a page compare equal.
+
+    Lowercases scheme and host, drops default ports, fragments and trailing
+    slashes, and sorts the query string.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rpartition(":")[2]) in (("http", "80"), ("https", "443")):
+        netloc = netloc.rpartition(":")[0]
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
 def find_subpages(links, base_url):
-    base_domain = urlparse(base_url).netloc
-    subpages = set()
+    base_domain = _netloc(base_url)
+    # canonical key -> (priority, first URL seen), so near-duplicates are
+    # fetched once; the IR page itself maps to None and is never returned
+    subpages = {canonical_url(base_url): None}
     for link in links:
         url = link["url"]
-        if urlparse(url).netloc != base_domain:
+        if _netloc(url) != base_domain:
+            continue
+        url_lower = url.lower()
+        if url_lower.endswith(".pdf"):
             continue
-        if url.lower().endswith(".pdf"):
+        combined = f"{url_lower} {link['text'].lower()}"
+        priority = max((w for kw, w in SUBPAGE_KEYWORDS.items() if kw in combined), default=0)
+        if not priority:
             continue
-        combined = f"{link['url'].lower()} {link['text'].lower()}"
-        if any(kw in combined for kw in SUBPAGE_KEYWORDS):
-            subpages.add(url)
-    return list(subpages)[:8]
+        key = canonical_url(url)
+        seen = subpages.get(key, (0, None))
+        if seen is not None and priority > seen[0]:
+            subpages[key] = (priority, seen[1] or url)
+    # Stable sort keeps page order among equally ranked candidates
+    ranked = sorted((v for v in subpages.values() if v), key=lambda v: -v[0])
+    return [url for _, url in ranked[:MAX_SUBPAGES]]
+
+
+def _best_pdf_link(links, year, company_name, aliases, best=(0, None, "")):
+    """Fold PDF links into the running best (score, url, text) candidate."""
+    for link in links:
+        if link["url"].lower().endswith(".pdf"):
+            s = score_annual_report(link, year, company_name, aliases)
+            if s > 0:
+                best = max(best, (s, link["url"], link["text"]))
+    return best
 
 
 def find_annual_report_url(ir_url, company_name, year, aliases=None):
     """Find the best annual report PDF URL. Returns (url, score) or (None, 0)."""
     try:
-        html = fetch_page(ir_url)
+        all_links = fetch_links(ir_url)
     except Exception as e:
         logger.warning(f"  Failed to fetch {ir_url}: {e}")
         return None, 0
 
-    all_links = extract_links(html, ir_url)
-    candidates = []
-
-    for link in all_links:
-        if link["url"].lower().endswith(".pdf"):
-            s = score_annual_report(link, year, company_name, aliases)
-            if s > 0:
-                candidates.append((s, link["url"], link["text"]))
-
-    if not candidates or max(c[0] for c in candidates) < 25:
-        for sp_url in find_subpages(all_links, ir_url):
-            try:
-                sp_html = fetch_page(sp_url)
-                for link in extract_links(sp_html, sp_url):
-                    if link["url"].lower().endswith(".pdf"):
-                        s = score_annual_report(link, year, company_name, aliases)
-                        if s > 0:
-                            candidates.append((s, link["url"], link["text"]))
-            except Exception:
-                continue
-            time.sleep(0.5)
-
-    if not candidates:
+    best = _best_pdf_link(all_links, year, company_name, aliases)
+
+    if best[0] < 25:
+        # Subpages are independent fetches on the same host; a small pool
+        # overlaps their latency while staying polite
+        subpages = find_subpages(all_links, ir_url)
+        with ThreadPoolExecutor(max_workers=SUBPAGE_WORKERS) as pool:
+            futures = {pool.submit(fetch_links, sp_url): sp_url for sp_url in subpages}
+            for future in as_completed(futures):
+                try:
+                    sp_links = future.result()
+                except Exception:
+                    continue
+                best = _best_pdf_link(sp_links, year, company_name, aliases, best)
+
+    score, url, _ = best
+    if url is None:
         return None, 0
-    candidates.sort(reverse=True)
-    return candidates[0][1], candidates[0][0]
+    return url, score
 
 
 # ---------------------------------------------------------------------------
 # Download & validate
 # ---------------------------------------------------------------------------
 
-def download_pdf(url, output_path, timeout=60):
-    headers = {"User-Agent": USER_AGENT}
-    resp = requests.get(url, headers=headers, timeout=timeout, stream=True)
-    resp.raise_for_status()
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "wb") as f:
-        for chunk in resp.iter_content(chunk_size=8192):
-            f.write(chunk)
-    return output_path
+def _backoff_delay(attempt, resp=None, base=1.0, cap=30.0, jitter=0.2):
+    """Seconds to wait before retrying, preferring the server's Retry-After."""
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)
+                return min(cap, max(0.0, (when - datetime.now(timezone.utc)).total_seconds()))
+            except (TypeError, ValueError):
+                pass
+    delay = min(cap, base * 2 ** attempt)
+    return delay * (1 + random.uniform(-jitter, jitter))
+
+
+def download_pdf(url, output_path, timeout=60, max_retries=MAX_RETRIES):
+    if max_retries < 1:
+        raise ValueError(f"max_retries must be >= 1, got {max_retries}")
+    for attempt in range(max_retries):
+        last_attempt = attempt == max_retries - 1
+        _wait_for_host(url)
+        try:
+            resp = SESSION.get(url, timeout=timeout, stream=True)
+        except (requests.ConnectionError, requests.Timeout):
+            if last_attempt:
+                raise
+            time.sleep(_backoff_delay(attempt))
+            continue
+        if resp.status_code in RETRY_STATUSES and not last_attempt:
+            resp.close()
+            time.sleep(_backoff_delay(attempt, resp))
+            continue
+        break
+
+    try:
+        resp.raise_for_status()
+        # Login walls and soft 404s come back as 200 HTML; reject them before
+        # anything touches the disk
+        content_type = resp.headers.get("Content-Type", "").lower()
+        if content_type.startswith(HTML_CONTENT_TYPES):
+            raise ValueError(f"not a PDF ({content_type})")
+        # verify_pdf would reject it anyway; the GET headers say so for free.
+        # Content-Length is the size on the wire, which is only the file size
+        # when the body is not compressed in transit
+        encoding = resp.headers.get("Content-Encoding", "").strip().lower()
+        length = resp.headers.get("Content-Length", "") if encoding in ("", "identity") else ""
+        if length.isdigit() and int(length) < MIN_PDF_KB * 1024:
+            raise ValueError(f"too small ({int(length) // 1024}KB)")
+        chunks = resp.iter_content(chunk_size=CHUNK_SIZE)
+        # Chunked responses arrive in whatever pieces the server sent; buffer
+        # enough of the body for the magic bytes and linearization dictionary
+        head = b""
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= PDF_HEAD_BYTES:
+                break
+        if not head.startswith(b"%PDF-"):
+            raise ValueError("not a PDF")
+        # Linearized PDFs state their page count up front; summary decks and
+        # full-year bundles can be dropped without transferring the rest
+        pages = _linearized_page_count(head, int(length)) if length.isdigit() else None
+        if pages is not None and not MIN_PAGES <= pages <= MAX_PAGES:
+            raise ValueError(f"outside page range ({pages} pages)")
+
+        # Stream into a temp file and swap it in atomically, so an interrupted
+        # download never leaves a partial PDF that a later run would adopt
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output_path.with_suffix(".tmp")
+        # Hash while streaming so verification never has to re-read the file
+        h = hashlib.sha256(head)
+        try:
+            with open(tmp, "wb") as f:
+                f.write(head)
+                for chunk in chunks:
+                    h.update(chunk)
+                    f.write(chunk)
+            tmp.replace(output_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+    finally:
+        resp.close()
+    return h.hexdigest()
 
 
 def sha256_file(path):
     h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
             h.update(chunk)
     return h.hexdigest()
 
 
-def verify_pdf(pdf_path, min_pages=30, max_pages=600, min_size_kb=500):
+def _pdf_object(mm, num, gen):
+    """Return the body of the last definition of object `num gen`, or None."""
+    needle = b"%d %d obj" % (num, gen)
+    end = len(mm)
+    while (pos := mm.rfind(needle, 0, end)) >= 0:
+        if pos == 0 or not mm[pos - 1:pos].isdigit():
+            stop = mm.find(b"endobj", pos)
+            return mm[pos:stop] if stop >= 0 else None
+        end = pos
+    return None
+
+
+def _linearized_page_count(head, file_length):
+    """Page count from a linearization dictionary at the start of the file.
+
+    Trusted only while /L still matches the file length, i.e. no incremental
+    update was appended since. Returns None when not linearized.
+    """
+    head = head[:PDF_HEAD_BYTES]
+    if b"/Linearized" not in head:
+        return None
+    length = _PDF_LIN_LENGTH_RE.search(head)
+    count = _PDF_LIN_PAGES_RE.search(head)
+    if length and count and int(length[1]) == file_length:
+        return int(count[1])
+    return None
+
+
+def _fast_page_count(mm):
+    """Read the page count without walking the page tree.
+
+    Linearized files carry it as /N in their first object; otherwise follow
+    trailer /Root -> /Pages -> /Count. Returns None when the objects are not
+    stored as plain text (e.g. inside compressed object streams) or the file
+    looks truncated, so the caller falls back to a full parse.
+    """
+    if b"%%EOF" not in mm[-1024:]:
+        return None
+    pages = _linearized_page_count(mm[:PDF_HEAD_BYTES], len(mm))
+    if pages is not None:
+        return pages
+
+    pos = mm.rfind(b"/Root")
+    ref = _PDF_REF_RE.match(mm, pos + 5) if pos >= 0 else None
+    if not ref:
+        return None
+    root = _pdf_object(mm, int(ref[1]), int(ref[2]))
+    ref = _PDF_PAGES_RE.search(root) if root else None
+    if not ref:
+        return None
+    pages = _pdf_object(mm, int(ref[1]), int(ref[2]))
+    count = _PDF_COUNT_RE.search(pages) if pages else None
+    return int(count[1]) if count else None
+
+
+def pdf_page_count(path):
+    """Page count from the PDF catalog, falling back to a full PyPDF2 parse."""
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pages = _fast_page_count(mm)
+    except (OSError, ValueError):
+        pages = None
+    if pages is None:
+        pages = len(PdfReader(str(path)).pages)
+    return pages
+
+
+def verify_pdf(pdf_path, min_pages=MIN_PAGES, max_pages=MAX_PAGES, min_size_kb=MIN_PDF_KB):
     """Verify a PDF is a plausible annual report.
 
     Returns (ok, pages, size_mb, error_msg).
@@ -256,7 +583,7 @@ def verify_pdf(pdf_path, min_pages=30, max_pages=600, min_size_kb=500):
             return False, 0, size_mb, "not a PDF"
 
     try:
-        pages = len(PdfReader(str(path)).pages)
+        pages = pdf_page_count(path)
     except Exception as e:
         return False, 0, size_mb, f"unreadable PDF: {e}"
 
@@ -299,6 +626,9 @@ def process_transaction(tx_id, tx, sources, reports_dir):
     direct_urls = company.get("direct_urls", {})
     filepath = Path(reports_dir) / cid / f"{cid}_{year}_annual_report.pdf"
 
+    # Digest computed while downloading; only recorded once the file verifies
+    sha256 = None
+
     # --- Step 1: Download ---------------------------------------------------
     if tx["status"] == "pending":
         # Check if file already exists on disk (e.g. from previous run)
@@ -324,7 +654,7 @@ def process_transaction(tx_id, tx, sources, reports_dir):
                 return tx["status"]
 
             try:
-                download_pdf(pdf_url, filepath)
+                sha256 = download_pdf(pdf_url, filepath)
             except Exception as e:
                 tx["status"] = "failed"
                 tx["error"] = f"download error: {e}"
@@ -353,7 +683,7 @@ def process_transaction(tx_id, tx, sources, reports_dir):
 
         tx["pages"] = pages
         tx["size_mb"] = size_mb
-        tx["sha256"] = sha256_file(actual_path)
+        tx["sha256"] = sha256 or sha256_file(actual_path)
         tx["status"] = "complete"
         tx["verified_at"] = now
         logger.info(f"  [{tx_id}] Complete ({pages}p, {size_mb}MB)")
@@ -376,38 +706,76 @@ def run(sources_path="report_sources.yaml", manifest_path="manifest.json",
     manifest["meta"]["current_tx"] = None
     save_manifest(manifest, manifest_path)
 
-    completed = failed = skipped = 0
-
-    try:
-        for tx_id, tx in sorted(txs.items()):
-            if tx["status"] == "complete":
-                skipped += 1
-                continue
-
-            if company_filter and tx["cid"] != company_filter:
-                skipped += 1
-                continue
-
-            # Broadcast which transaction is active
-            manifest["meta"]["current_tx"] = tx_id
-            save_manifest(manifest, manifest_path)
+    # Companies are processed in parallel and each company's years in order;
+    # per-host politeness is enforced by _wait_for_host
+    by_company = defaultdict(list)
+    skipped = 0
+    for tx_id, tx in sorted(txs.items()):
+        if tx["status"] == "complete":
+            skipped += 1
+            continue
 
-            logger.info(f"\n--- {tx_id}: {tx['company']} {tx['year']} [{tx['status']}]")
-            result = process_transaction(tx_id, tx, sources, reports_dir)
+        if company_filter and tx["cid"] != company_filter:
+            skipped += 1
+            continue
 
-            if result == "complete":
-                completed += 1
-            elif result == "failed":
-                failed += 1
+        by_company[tx["cid"]].append(tx_id)
+
+    counts = Counter()
+    lock = threading.Lock()
+    # Set on Ctrl-C or a worker error so no further transactions are started
+    stop = threading.Event()
+    # Transactions in progress, oldest first; current_tx shows the most
+    # recently started one that is still running
+    active = []
+
+    def process_company(tx_ids):
+        try:
+            for tx_id in tx_ids:
+                if stop.is_set():
+                    return
+                # Broadcast which transaction is active; work on a copy so the
+                # manifest can be saved by other workers while this one runs
+                with lock:
+                    active.append(tx_id)
+                    manifest["meta"]["current_tx"] = tx_id
+                    save_manifest(manifest, manifest_path)
+                    tx = dict(txs[tx_id])
+
+                logger.info(f"\n--- {tx_id}: {tx['company']} {tx['year']} [{tx['status']}]")
+                try:
+                    result = process_transaction(tx_id, tx, sources, reports_dir)
+                finally:
+                    with lock:
+                        active.remove(tx_id)
+                        manifest["meta"]["current_tx"] = active[-1] if active else None
+
+                # Save after each transaction (crash-safe)
+                with lock:
+                    txs[tx_id] = tx
+                    counts[result] += 1
+                    save_manifest(manifest, manifest_path)
+        except BaseException:
+            stop.set()
+            raise
 
-            # Save after each transaction (crash-safe)
+    try:
+        pool = ThreadPoolExecutor(max_workers=COMPANY_WORKERS)
+        try:
+            for future in [pool.submit(process_company, ids) for ids in by_company.values()]:
+                future.result()
+        except BaseException:
+            # Let running transactions finish, but start no new ones
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            raise
+        pool.shutdown()
+    finally:
+        # Always clear live state on exit; workers may still be saving if a
+        # second interrupt cut the shutdown short
+        with lock:
+            manifest["meta"]["live"] = False
             manifest["meta"]["current_tx"] = None
             save_manifest(manifest, manifest_path)
-            time.sleep(1)
-    finally:
-        # Always clear live state on exit
-        manifest["meta"]["live"] = False
-        manifest["meta"]["current_tx"] = None
-        save_manifest(manifest, manifest_path)
 
-    return completed, failed, skipped
+    return counts["complete"], counts["failed"], skipped
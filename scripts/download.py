@@ -9,6 +9,7 @@ import argparse
 import logging
 import sys
 import threading
+from collections import Counter
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
 
@@ -106,9 +107,10 @@ def main():
     manifest = load_manifest(args.manifest)
     txs = manifest["transactions"]
     total = len(txs)
-    total_complete = sum(1 for t in txs.values() if t["status"] == "complete")
-    total_failed = sum(1 for t in txs.values() if t["status"] == "failed")
-    total_pending = sum(1 for t in txs.values() if t["status"] == "pending")
+    status_counts = Counter(t["status"] for t in txs.values())
+    total_complete = status_counts["complete"]
+    total_failed = status_counts["failed"]
+    total_pending = status_counts["pending"]
 
     print(f"\n{'=' * 60}")
     print(f"This run:  +{completed} complete, {failed} failed, {skipped} skipped")
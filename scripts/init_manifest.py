@@ -7,6 +7,7 @@ Scans companies_validated/ and creates 'complete' transactions for every valid P
 
 import logging
 import sys
+from collections import Counter
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -72,8 +73,9 @@ def main():
     save_manifest(manifest, manifest_path)
 
     total = len(txs)
-    complete = sum(1 for t in txs.values() if t["status"] == "complete")
-    pending = sum(1 for t in txs.values() if t["status"] == "pending")
+    status_counts = Counter(t["status"] for t in txs.values())
+    complete = status_counts["complete"]
+    pending = status_counts["pending"]
 
     print(f"\nMigrated {migrated} existing reports")
     print(f"Manifest: {complete}/{total} complete, {pending} pending")